@@ -12,13 +12,47 @@ from __future__ import annotations
 
 import re
 import zipfile
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from lxml import etree
 
 from .namespace import qn
 
 
+# noinspection PyPep8Naming
+def _collect_abstractNum_fmts(abstractNum: etree._Element) -> Tuple[str, List[str]]:
+    """
+    Pull abstractNumId and numFmt-per-ilvl from one ``<w:abstractNum>`` element.
+
+    :param abstractNum: a ``<w:abstractNum>`` element from ``word/numbering.xml``
+    :returns: abstractNumId and a list of numFmts (by ilvl)
+    """
+    id_ = str(abstractNum.attrib[qn("w:abstractNumId")])
+    numFmts: List[str] = []
+    for lvl in abstractNum.findall(qn("w:lvl")):
+        numFmt = lvl.find(qn("w:numFmt"))
+        if numFmt is not None:
+            numFmts.append(str(numFmt.attrib[qn("w:val")]))
+    return id_, numFmts
+
+
+# noinspection PyPep8Naming
+def _collect_num_ref(num: etree._Element) -> Optional[Tuple[str, str]]:
+    """
+    Pull numId and referenced abstractNumId from one ``<w:num>`` element.
+
+    :param num: a ``<w:num>`` element from ``word/numbering.xml``
+    :returns: numId and abstractNumId, or None if either reference is missing
+    """
+    numId = num.attrib.get(qn("w:numId"))
+    if numId is None:
+        return None
+    abstractNumId = num.find(qn("w:abstractNumId"))
+    if abstractNumId is None:
+        return None
+    return str(numId), str(abstractNumId.attrib.get(qn("w:val")))
+
+
 # noinspection PyPep8Naming
 def collect_numFmts(numFmts_root: etree._Element) -> Dict[str, List[str]]:
     """
@@ -63,30 +97,61 @@ def collect_numFmts(numFmts_root: etree._Element) -> Dict[str, List[str]]:
         }
     """
     abstractNumId2numFmts: Dict[str, List[str]] = {}
-
     for abstractNum in numFmts_root.findall(qn("w:abstractNum")):
-        id_ = str(abstractNum.attrib[qn("w:abstractNumId")])
-        abstractNumId2numFmts[id_] = []
-        for lvl in abstractNum.findall(qn("w:lvl")):
-            numFmt = lvl.find(qn("w:numFmt"))
-            if numFmt is not None:
-                abstractNumId2numFmts[id_].append(str(numFmt.attrib[qn("w:val")]))
+        id_, numFmts = _collect_abstractNum_fmts(abstractNum)
+        abstractNumId2numFmts[id_] = numFmts
 
     numId2numFmts = {}
-    num: etree._Element
-    for num in (x for x in numFmts_root.findall(qn("w:num")) if x is not None):
-        numId = num.attrib[qn("w:numId")]
-        if numId is None:
-            continue
-        abstractNumId = num.find(qn("w:abstractNumId"))
-        if abstractNumId is None:
+    for num in numFmts_root.findall(qn("w:num")):
+        num_ref = _collect_num_ref(num)
+        if num_ref is None:
             continue
-        abstractNumIdval = abstractNumId.attrib.get(qn("w:val"))
-        numId2numFmts[str(numId)] = abstractNumId2numFmts[str(abstractNumIdval)]
+        numId, abstractNumIdval = num_ref
+        numId2numFmts[numId] = abstractNumId2numFmts[abstractNumIdval]
 
     return numId2numFmts
 
 
+# noinspection PyPep8Naming
+def stream_numFmts(numbering_file: BinaryIO) -> Dict[str, List[str]]:
+    """
+    Collect abstractNum bullet formats without materializing the full tree.
+
+    :param numbering_file: open (binary) file object for ``word/numbering.xml``,
+        e.g., from ``zipf.open("word/numbering.xml")``
+    :returns: numId mapped to numFmts (by ilvl), as ``collect_numFmts``
+
+    Same result as ``collect_numFmts``, but reads ``<w:abstractNum>`` and ``<w:num>``
+    elements from an incremental parse and clears each after use, so the numbering
+    xml is never held in memory all at once.
+    """
+    abstractNum_tag = qn("w:abstractNum")
+    abstractNumId2numFmts: Dict[str, List[str]] = {}
+    numId2abstractNumId: Dict[str, str] = {}
+    for _, elem in etree.iterparse(
+        numbering_file,
+        events=("end",),
+        tag=(abstractNum_tag, qn("w:num")),
+        collect_ids=False,
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    ):
+        if elem.tag == abstractNum_tag:
+            id_, numFmts = _collect_abstractNum_fmts(elem)
+            abstractNumId2numFmts[id_] = numFmts
+        else:
+            num_ref = _collect_num_ref(elem)
+            if num_ref is not None:
+                numId2abstractNumId[num_ref[0]] = num_ref[1]
+        elem.clear()
+
+    return {
+        numId: abstractNumId2numFmts[abstractNumId]
+        for numId, abstractNumId in numId2abstractNumId.items()
+    }
+
+
 def collect_rels(zipf: zipfile.ZipFile) -> Dict[str, List[Dict[str, str]]]:
     """
     Map file to relId to attrib
@@ -40,7 +40,7 @@ This is the format for default (no trailing "_runs", e.g ``header``) properties.
 """
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from warnings import warn
 
 from .docx_context import collect_docProps
@@ -104,7 +104,7 @@ class DocxContent:
         return self._get_runs("endnotes")
 
     @property
-    def images(self) -> Dict[str, bytes]:
+    def images(self) -> Mapping[str, bytes]:
         return self.docx_reader.pull_image_files(
             self.docx2python_kwargs["image_folder"]
         )
@@ -174,7 +174,7 @@ class DocxContent:
             )
             return {}
 
-    def save_images(self, image_folder: str) -> Dict[str, bytes]:
+    def save_images(self, image_folder: str) -> Mapping[str, bytes]:
         return self.docx_reader.pull_image_files(image_folder)
 
     def __del__(self):
@@ -25,25 +25,33 @@ from __future__ import annotations
 import copy
 import os
 import pathlib
+import shutil
+import weakref
 import zipfile
-from contextlib import suppress
-from dataclasses import dataclass
 from operator import attrgetter
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Union
 from warnings import warn
 from pathlib import Path
 
 from lxml import etree
 
 from .attribute_register import XML2HTML_FORMATTER
-from .docx_context import collect_numFmts, collect_rels
+from .docx_context import collect_rels, stream_numFmts
 from .docx_text import get_text
-from .merge_runs import merge_elems
+from .merge_runs import has_mergeable_elems, merge_elems
 
 CONTENT_FILE_TYPES = {"officeDocument", "header", "footer", "footnotes", "endnotes"}
 
+# parse settings for every xml file in the docx. Tree-building parses share this
+# parser instance; the etree.iterparse call sites (File.rels, stream_numFmts)
+# mirror the same keywords. docx2python never queries xml:id, so skip building
+# the id hash table. resolve_entities=False and no_network=True are standard
+# hardening against malicious xml.
+_PARSER = etree.XMLParser(
+    collect_ids=False, huge_tree=True, resolve_entities=False, no_network=True
+)
+
 
-@dataclass
 class File:
     """The attribute dict of a file in the docx, plus cached data
 
@@ -65,6 +73,19 @@ class File:
     created at runtime.
     """
 
+    __slots__ = (
+        "context",
+        "Id",
+        "Type",
+        "Target",
+        "dir",
+        "is_content",
+        "__path",
+        "__rels_path",
+        "__rels",
+        "__root_element",
+    )
+
     def __init__(self, context: DocxReader, attribute_dict: Dict[str, str]) -> None:
         """
         Point to container DocxContext instance and store attributes as properties.
@@ -73,13 +94,53 @@ class File:
         :param attribute_dict: Attributes of this file found in the rels, plus 'dir' as
         described above.
         """
-        self.context = context
-        self.Id = str(attribute_dict["Id"])
-        self.Type = os.path.basename(attribute_dict["Type"])
-        self.Target = attribute_dict["Target"]
-        self.dir = attribute_dict["dir"]
+        self._init_attrs(
+            context,
+            str(attribute_dict["Id"]),
+            attribute_dict["Type"],
+            attribute_dict["Target"],
+            attribute_dict["dir"],
+        )
+
+    # noinspection PyPep8Naming
+    @classmethod
+    def _from_attrs(
+        cls, context: DocxReader, Id: str, Type: str, Target: str, dir_: str
+    ) -> File:
+        """
+        Create a File from unpacked rels attributes.
 
-        # old-style cached_property for Python 3.6 and 3.7 support
+        :param context: The DocxContent object holding this instance
+        :param Id, Type, Target: attributes of this file found in the rels
+        :param dir_: directory where the rels attributes were found
+        :return: a new File instance
+
+        Faster equivalent of ``File(context, {**attribute_dict, "dir": dir_})`` for
+        the ``DocxReader.files`` hot loop--skips the dict merge and key lookups.
+        """
+        file = cls.__new__(cls)
+        file._init_attrs(context, Id, Type, Target, dir_)
+        return file
+
+    # noinspection PyPep8Naming
+    def _init_attrs(
+        self, context: DocxReader, Id: str, Type: str, Target: str, dir_: str
+    ) -> None:
+        """Assign instance attributes and prime the attribute caches."""
+        # a weak reference back to the container. The DocxReader owns its Files;
+        # without this, the mutual File<->DocxReader cycle would keep zipfile
+        # handles and lxml trees alive until the cyclic gc ran.
+        self.context = weakref.proxy(context)
+        self.Id = Id
+        # Type is a schema URI; its basename is the last '/'-delimited component.
+        # str.rpartition is one C call vs. the os.path machinery.
+        self.Type = Type.rpartition("/")[2]
+        self.Target = Target
+        self.dir = dir_
+        self.is_content = self.Type in CONTENT_FILE_TYPES
+
+        # old-style cached_property (functools.cached_property needs a __dict__,
+        # which __slots__ classes do not have)
         self.__path: Union[None, str] = None
         self.__rels_path: Union[None, str] = None
         self.__rels: Union[None, Dict[str, str]] = None
@@ -114,9 +175,9 @@ class File:
         if self.__path is not None:
             return self.__path
 
-        dirs = [os.path.dirname(x) for x in (self.dir, self.Target)]
+        dirs = [x.rpartition("/")[0] for x in (self.dir, self.Target)]
         dirname = "/".join([x for x in dirs if x])
-        filename = os.path.basename(self.Target)
+        filename = self.Target.rpartition("/")[2]
         self.__path = "/".join([dirname, filename])
         return self.__path
 
@@ -145,7 +206,7 @@ class File:
         """
         if self.__rels_path is not None:
             return self.__rels_path
-        dirname, filename = os.path.split(self.path)
+        dirname, _, filename = self.path.rpartition("/")
         self.__rels_path = "/".join([dirname, "_rels", filename + ".rels"])
         return self.__rels_path
 
@@ -177,12 +238,23 @@ class File:
         if self.__rels is not None:
             return self.__rels
 
+        rels: Dict[str, str] = {}
         try:
-            unzipped = self.context.zipf.read(self._rels_path)
-            tree = etree.fromstring(unzipped)
-            self.__rels = {str(x.attrib["Id"]): str(x.attrib["Target"]) for x in tree}
+            with self.context.zipf.open(self._rels_path) as unzipped:
+                for _, elem in etree.iterparse(
+                    unzipped,
+                    events=("end",),
+                    tag="{*}Relationship",
+                    collect_ids=False,
+                    huge_tree=True,
+                    resolve_entities=False,
+                    no_network=True,
+                ):
+                    rels[str(elem.attrib["Id"])] = str(elem.attrib["Target"])
+                    elem.clear()
         except KeyError:
-            self.__rels = {}
+            pass
+        self.__rels = rels
         return self.__rels
 
     @property
@@ -196,9 +268,9 @@ class File:
         if self.__root_element is not None:
             return self.__root_element
 
-        root = etree.fromstring(self.context.zipf.read(self.path))
-        if self.Type in CONTENT_FILE_TYPES:
-            root_ = copy.copy(root)
+        with self.context.zipf.open(self.path) as unzipped:
+            root = etree.parse(unzipped, _PARSER).getroot()
+        if self.is_content and has_mergeable_elems(root):
             try:
                 merge_elems(self, root)
             except Exception as ex:
@@ -207,7 +279,9 @@ class File:
                     f"{self.context.docx_filename} {self.path} resulted in "
                     f"{repr(ex)}. Moving on."
                 )
-                self.__root_element = root_
+                # re-parse to discard any partial merge
+                with self.context.zipf.open(self.path) as unzipped:
+                    root = etree.parse(unzipped, _PARSER).getroot()
         self.__root_element = root
         return self.__root_element
 
@@ -228,12 +302,24 @@ class File:
         return get_text(self, root)
 
 
-@dataclass
 class DocxReader:
     """
     Hold File instances and decode information shared between them (e.g., numFmts)
     """
 
+    __slots__ = (
+        "docx_filename",
+        "do_pStyle",
+        "xml2html_format",
+        "__zipf",
+        "__rels_map",
+        "__files",
+        "__files_by_type",
+        "__content_files",
+        "__numId2NumFmts",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         docx_filename: Union[Path, str],
@@ -248,9 +334,13 @@ class DocxReader:
         else:
             self.xml2html_format = {}
 
-        # old-style cached_propery for Python 3.6 and 3.7 support
+        # old-style cached_property (functools.cached_property needs a __dict__,
+        # which __slots__ classes do not have)
         self.__zipf: Union[None, zipfile.ZipFile] = None
+        self.__rels_map: Union[None, Dict[str, List[Dict[str, str]]]] = None
         self.__files: Union[None, List[File]] = None
+        self.__files_by_type: Union[None, Dict[str, List[File]]] = None
+        self.__content_files: Union[None, List[File]] = None
         self.__numId2NumFmts: Union[None, Dict[str, List[str]]] = None
 
     @property
@@ -264,6 +354,20 @@ class DocxReader:
         self.__zipf = zipfile.ZipFile(self.docx_filename)
         return self.__zipf
 
+    @property
+    def _rels_map(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Path to each rels file in the docx mapped to its relationships.
+
+        See docstring for collect_rels
+
+        Parsing the rels files means opening and decoding several xml files inside
+        the zip, so do it once and let every accessor share the result.
+        """
+        if self.__rels_map is None:
+            self.__rels_map = collect_rels(self.zipf)
+        return self.__rels_map
+
     @property
     def files(self) -> List[File]:
         """
@@ -272,9 +376,14 @@ class DocxReader:
         if self.__files is not None:
             return self.__files
 
-        files = []
-        for k, v in collect_rels(self.zipf).items():
-            files += [File(self, {**x, "dir": os.path.dirname(k)}) for x in v]
+        files: List[File] = []
+        files_extend = files.extend
+        for k, v in self._rels_map.items():
+            dir_ = k.rpartition("/")[0]
+            files_extend(
+                File._from_attrs(self, x["Id"], x["Type"], x["Target"], dir_)
+                for x in v
+            )
         self.__files = files
         return self.__files
 
@@ -294,8 +403,8 @@ class DocxReader:
             return self.__numId2NumFmts
 
         try:
-            numFmts_root = etree.fromstring(self.zipf.read("word/numbering.xml"))
-            self.__numId2NumFmts = collect_numFmts(numFmts_root)
+            with self.zipf.open("word/numbering.xml") as unzipped:
+                self.__numId2NumFmts = stream_numFmts(unzipped)
         except KeyError:
             self.__numId2NumFmts = {}
         return self.__numId2NumFmts
@@ -311,13 +420,13 @@ class DocxReader:
         """
         files_of_type = self.files_of_type(type_)
         if len(files_of_type) > 1:
-            warn("Multiple files of type '{type_}' found. Returning first.")
+            warn(f"Multiple files of type '{type_}' found. Returning first.")
         try:
             return files_of_type[0]
         except IndexError:
             raise KeyError(
                 f"There is no item of type '{type_}' "
-                "in the {self.docx_filename} archive"
+                f"in the {self.docx_filename} archive"
             )
 
     def files_of_type(self, type_: Optional[str] = None) -> List[File]:
@@ -331,13 +440,28 @@ class DocxReader:
         :return: File instances of the requested type, sorted by path
         """
         if type_ is None:
-            types = CONTENT_FILE_TYPES
-        else:
-            types = {type_}
+            return self.content_files()
+        # copy so callers can sort or mutate without corrupting the cache
+        return list(self._files_by_type.get(type_, []))
 
-        return sorted(
-            (x for x in self.files if x.Type in types), key=attrgetter("path")
-        )
+    @property
+    def _files_by_type(self) -> Dict[str, List[File]]:
+        """
+        File instances grouped by Type, each group sorted by path.
+
+        The file set never mutates, so group and sort once instead of re-scanning
+        and re-sorting self.files on every files_of_type call.
+        """
+        if self.__files_by_type is not None:
+            return self.__files_by_type
+
+        files_by_type: Dict[str, List[File]] = {}
+        for file in self.files:
+            files_by_type.setdefault(file.Type, []).append(file)
+        for group in files_by_type.values():
+            group.sort(key=attrgetter("path"))
+        self.__files_by_type = files_by_type
+        return self.__files_by_type
 
     def content_files(self) -> List[File]:
         """
@@ -345,7 +469,15 @@ class DocxReader:
 
         :return: File instances of context files, sorted by path
         """
-        return self.files_of_type()
+        if self.__content_files is None:
+            files_by_type = self._files_by_type
+            content_files = [
+                x for t in CONTENT_FILE_TYPES for x in files_by_type.get(t, [])
+            ]
+            content_files.sort(key=attrgetter("path"))
+            self.__content_files = content_files
+        # copy so callers can sort or mutate without corrupting the cache
+        return list(self.__content_files)
 
     def save(self, filename: Union[Path, str]) -> None:
         """
@@ -357,7 +489,7 @@ class DocxReader:
         This allows saving a copy of the input docx after the ``merge_elems`` operation.
         Also allows some light editing like search and replace.
         """
-        content_files = [x for x in self.files if x.Type in CONTENT_FILE_TYPES]
+        content_files = [x for x in self.files if x.is_content]
         with zipfile.ZipFile(f"{filename}", mode="w") as zout:
             _copy_but(self.zipf, zout, {x.path for x in content_files})
             for file in content_files:
@@ -365,7 +497,7 @@ class DocxReader:
 
     def pull_image_files(
         self, image_directory: Optional[str] = None
-    ) -> Dict[str, bytes]:
+    ) -> Mapping[str, bytes]:
         """
         Copy images from zip file.
 
@@ -379,23 +511,69 @@ class DocxReader:
 
         :side effects: Given an optional image_directory, will write the images out
         to file.
+
+        Images are written to image_directory straight from the zipfile. The
+        returned mapping reads image bytes on demand, so an image is only held in
+        memory if the caller actually requests it.
         """
-        images = {}
-        for image in self.files_of_type("image"):
-            with suppress(KeyError):
-                images[os.path.basename(image.Target)] = self.zipf.read(image.path)
+        zip_names = set(self.zipf.namelist())
+        basename2path = {
+            os.path.basename(x.Target): x.path
+            for x in self.files_of_type("image")
+            if x.path in zip_names
+        }
         if image_directory is not None:
             pathlib.Path(image_directory).mkdir(parents=True, exist_ok=True)
-            for file, image_bytes in images.items():
-                with open(os.path.join(image_directory, file), "wb") as image_copy:
-                    image_copy.write(image_bytes)
-        return images
+            for basename, path in basename2path.items():
+                image_copy_path = os.path.join(image_directory, basename)
+                with self.zipf.open(path) as image, open(
+                    image_copy_path, "wb"
+                ) as image_copy:
+                    shutil.copyfileobj(image, image_copy)
+        return _PulledImages(self, basename2path)
+
+    def close(self) -> None:
+        """Close the zipfile, if it was ever opened."""
+        if self.__zipf is not None:
+            self.__zipf.close()
+            self.__zipf = None
+
+    def __enter__(self) -> DocxReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-    def close(self):
-        self.__zipf.close()
 
-    def __del__(self):
-        self.__zipf.close()
+class _PulledImages(Mapping):
+    """Image basenames mapped (lazily) to image bytes.
+
+    Behaves like the ``Dict[str, bytes]`` previously returned by
+    ``DocxReader.pull_image_files``, but reads image bytes from the docx zipfile
+    on request instead of materializing every image up front.
+    """
+
+    __slots__ = ("_context", "_basename2path")
+
+    def __init__(self, context: DocxReader, basename2path: Dict[str, str]) -> None:
+        """
+        Point to the container DocxReader and map image basenames to zip paths.
+
+        :param context: the DocxReader holding the images
+        :param basename2path: image basenames mapped to paths inside the zipfile
+        """
+        self._context = context
+        self._basename2path = basename2path
+
+    def __getitem__(self, basename: str) -> bytes:
+        return self._context.zipf.read(self._basename2path[basename])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._basename2path)
+
+    def __len__(self) -> int:
+        return len(self._basename2path)
+
 
 def _copy_but(
     in_zip: zipfile.ZipFile, out_zip: zipfile.ZipFile, exclusions: Optional[Set] = None
@@ -406,11 +584,18 @@ def _copy_but(
     :param in_zip: zipfile of origin xml file
     :param out_zip: zipfile of destination xml file
     :param exclusions: filenames you don't want to copy (e.g., 'document.xml')
+
+    Stream each entry through a bounded buffer instead of materializing full
+    bytes objects (embedded images can be large). Closing the zipfiles is the
+    caller's responsibility.
     """
-    exclusions = exclusions or set()
+    exclusions = exclusions or frozenset()
     for item in in_zip.infolist():
-        if item.filename not in exclusions:
-            buffer = in_zip.read(item.filename)
-            out_zip.writestr(item, buffer)
-    in_zip.close()
-    out_zip.close()
\ No newline at end of file
+        if item.filename in exclusions:
+            continue
+        # writing mutates the ZipInfo in place (header offset, crc, ...), so give
+        # out_zip a copy or in_zip's directory would be corrupted for later reads
+        with in_zip.open(item) as source, out_zip.open(
+            copy.copy(item), "w"
+        ) as destination:
+            shutil.copyfileobj(source, destination, length=1 << 20)
\ No newline at end of file
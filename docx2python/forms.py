@@ -13,12 +13,22 @@ crossed-out checkboxes. Pypi doesn't like them in my file, so I have to referenc
 them by their escape sequences.
 """
 
-from contextlib import suppress
 from typing import Union
 
 from lxml import etree
 
-from .namespace import qn
+from .namespace import NSMAP, qn
+
+# qualified names resolved once; these lookups run for every form element visited
+_QN_VAL = qn("w:val")
+_QN_LISTENTRY = qn("w:listEntry")
+_QN_RESULT = qn("w:result")
+
+# compiled once, evaluated in C on every checkBox element visited
+_CHECKED_XP = etree.XPath("./w:checked[1]", namespaces={"w": NSMAP["w"]})
+_DEFAULT_XP = etree.XPath("./w:default[1]", namespaces={"w": NSMAP["w"]})
+
+_CHECKBOX_MAP = {"0": "\u2610", "1": "\u2612"}
 
 
 # noinspection PyPep8Naming
@@ -50,17 +60,15 @@ def get_checkBox_entry(checkBox: etree._Element) -> str:
     If the ``checked`` attribute is absent, return the default
     If the ``checked`` attribute is present, but not w:val is given, return unchecked
     """
-
-    def get_wval() -> Union[str, None]:
-        with suppress(StopIteration):
-            checked = next(checkBox.iterfind(qn("w:checked")))
-            return str(checked.attrib.get(qn("w:val")) or "1")
-        with suppress(StopIteration, KeyError):
-            default = next(checkBox.iterfind(qn("w:default")))
-            return str(default.attrib[qn("w:val")])
-        return None
-
-    return {"0": "\u2610", "1": "\u2612", None: "----checkbox failed----"}[get_wval()]
+    wval: Union[str, None] = None
+    checked = _CHECKED_XP(checkBox)
+    if checked:
+        wval = str(checked[0].attrib.get(_QN_VAL) or "1")
+    else:
+        default = _DEFAULT_XP(checkBox)
+        if default:
+            wval = default[0].attrib.get(_QN_VAL)
+    return _CHECKBOX_MAP.get(wval, "----checkbox failed----")
 
 
 # noinspection PyPep8Naming
@@ -75,12 +83,15 @@ def get_ddList_entry(ddList: etree._Element) -> str:
 
     <w:result w:val="0"/> might be missing when selection is "0"
     """
-    list_entries = [
-        x.attrib.get(qn("w:val")) for x in ddList.findall(qn("w:listEntry"))
-    ]
-    try:
-        result = next(ddList.iterfind(qn("w:result")))
-        list_index = int(result.attrib[qn("w:val")])
-    except (StopIteration, KeyError):
-        list_index = 0
+    list_entries = []
+    list_index = 0
+    for child in ddList:
+        tag = child.tag
+        if tag == _QN_LISTENTRY:
+            list_entries.append(child.attrib.get(_QN_VAL))
+        elif tag == _QN_RESULT:
+            try:
+                list_index = int(child.attrib[_QN_VAL])
+            except KeyError:
+                pass
     return str(list_entries[list_index])
@@ -16,6 +16,7 @@ from typing import List, TYPE_CHECKING, Tuple
 from lxml import etree
 
 from .attribute_register import RELS_ID, Tags, has_content
+from .namespace import NSMAP
 from .text_runs import get_html_formatting
 
 if TYPE_CHECKING:
@@ -24,6 +25,30 @@ if TYPE_CHECKING:
 # identify tags that will be merged together (if formatting is equivalent)
 _MERGEABLE_TAGS = {Tags.RUN, Tags.HYPERLINK, Tags.TEXT, Tags.TEXT_MATH}
 
+# True if any parent in the tree holds two or more children of the same mergeable
+# tag--a necessary condition for merge_elems to merge anything. Compiled once;
+# evaluated in C, far cheaper than a Python-level merge traversal.
+_HAS_MERGEABLE_SIBLINGS = etree.XPath(
+    "boolean(//w:r[following-sibling::w:r]"
+    " | //w:hyperlink[following-sibling::w:hyperlink]"
+    " | //w:t[following-sibling::w:t]"
+    " | //m:t[following-sibling::m:t])",
+    namespaces={"w": NSMAP["w"], "m": NSMAP["m"]},
+)
+
+
+def has_mergeable_elems(tree: etree._Element) -> bool:
+    """
+    Could merge_elems possibly merge anything in this tree?
+
+    :param tree: root_element from an xml in File instance
+    :return: False if no parent anywhere in the tree has two children of the same
+        mergeable tag. Documents from simple generators often emit single-run
+        paragraphs throughout; this cheap test lets callers skip merge_elems
+        entirely for those.
+    """
+    return bool(_HAS_MERGEABLE_SIBLINGS(tree))
+
 
 def _elem_key(file: File, elem: etree._Element) -> Tuple[str, str, List[str]]:
     # noinspection SpellCheckingInspection
@@ -11,7 +11,7 @@ from tempfile import TemporaryDirectory
 
 from docx2python.attribute_register import Tags
 from docx2python.docx_context import collect_numFmts
-from docx2python.docx_reader import DocxReader
+from docx2python.docx_reader import _PARSER, DocxReader
 from docx2python.iterators import iter_at_depth
 from docx2python.main import docx2python
 from lxml import etree
@@ -47,6 +47,20 @@ class TestSaveDocx:
         assert "bullet" not in output_text
         assert "BULLET" in output_text
 
+    def test_save_then_read(self) -> None:
+        """Input reader is still readable after save.
+
+        Writing an entry mutates its ZipInfo in place, so _copy_but must not
+        hand the input zipfile's ZipInfo instances to the output zipfile.
+        """
+        input_context = DocxReader(example_docx)
+        input_context.save(example_copy_docx)
+        images = input_context.pull_image_files()
+        assert {x: len(images[x]) > 0 for x in images} == {
+            "image1.png": True,
+            "image2.jpg": True,
+        }
+
 
 class TestCollectNumFmts:
     """Test strip_text.collect_numFmts"""
@@ -63,7 +77,7 @@ class TestCollectNumFmts:
         """
         zipf = zipfile.ZipFile(example_docx)
         numId2numFmts = collect_numFmts(
-            etree.fromstring(zipf.read("word/numbering.xml"))
+            etree.fromstring(zipf.read("word/numbering.xml"), _PARSER)
         )
         formats = {x for y in numId2numFmts.values() for x in y}
         assert formats == {
@@ -102,7 +116,7 @@ class TestGetContext:
         """All targets mapped"""
         docx_context = DocxReader(example_docx)
         assert docx_context.numId2numFmts == collect_numFmts(
-            etree.fromstring(docx_context.zipf.read("word/numbering.xml"))
+            etree.fromstring(docx_context.zipf.read("word/numbering.xml"), _PARSER)
         )
 
     def test_lists(self) -> None: